@@ -0,0 +1,33 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import os
+
+import torch
+from lightning.pytorch import Trainer
+
+from torchgeo.datamodules import COWCCountingDataModule
+from torchgeo.datasets import COWCCounting
+
+
+class TestCOWCCountingDataModule:
+    def test_uint8_images(self) -> None:
+        root = os.path.join("tests", "data", "cowc_counting")
+        dm = COWCCountingDataModule(root=root, download=True, batch_size=1)
+        dm.trainer = Trainer(accelerator="cpu", max_epochs=1)
+        dm.trainer.training = True
+        dm.setup("fit")
+        assert type(dm.dataset) is COWCCounting
+        batch = next(iter(dm.train_dataloader()))
+        assert batch["image"].dtype == torch.uint8
+        batch = dm.on_after_batch_transfer(batch, 0)
+        assert batch["image"].dtype == torch.float32
+
+    def test_transforms(self) -> None:
+        root = os.path.join("tests", "data", "cowc_counting")
+        dm = COWCCountingDataModule(
+            root=root, download=True, batch_size=1, transforms=lambda x: x
+        )
+        dm.setup("fit")
+        batch = next(iter(dm.train_dataloader()))
+        assert batch["image"].dtype == torch.float32
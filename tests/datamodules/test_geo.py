@@ -3,12 +3,14 @@
 
 from typing import Any
 
+import kornia.augmentation as K
 import matplotlib.pyplot as plt
 import pytest
 import torch
 from _pytest.fixtures import SubRequest
 from lightning.pytorch import Trainer
 from matplotlib.figure import Figure
+from pytest import MonkeyPatch
 from rasterio.crs import CRS
 from torch import Tensor
 
@@ -213,6 +215,7 @@ class TestNonGeoDataModule:
             datamodule.trainer.training = True
         batch = next(iter(datamodule.train_dataloader()))
         batch = datamodule.on_after_batch_transfer(batch, 0)
+        assert batch["image"].dtype == torch.float32
 
     def test_val(self, datamodule: CustomNonGeoDataModule) -> None:
         datamodule.setup("validate")
@@ -235,11 +238,137 @@ class TestNonGeoDataModule:
         batch = next(iter(datamodule.predict_dataloader()))
         batch = datamodule.on_after_batch_transfer(batch, 0)
 
+    def test_no_stage(self, datamodule: CustomNonGeoDataModule) -> None:
+        datamodule.setup("fit")
+        assert datamodule.trainer is not None
+        assert datamodule.trainer.state.stage is None
+        batch = next(iter(datamodule.train_dataloader()))
+        batch = datamodule.on_after_batch_transfer(batch, 0)
+        expected = torch.arange(12.0).view(1, 3, 2, 2) / 255
+        assert torch.allclose(batch["image"], expected)
+
     def test_plot(self, datamodule: CustomNonGeoDataModule) -> None:
         datamodule.setup("validate")
         datamodule.plot()
         plt.close()
 
+    def test_dataset_cache(self) -> None:
+        dm = CustomNonGeoDataModule()
+        dm.setup("fit")
+        val_dataset = dm.val_dataset
+        dm.setup("validate")
+        assert dm.val_dataset is val_dataset
+
+    @pytest.mark.parametrize("aug_backend", ["torch", "kornia"])
+    def test_aug_backend(self, aug_backend: str) -> None:
+        dm = NonGeoDataModule(CustomNonGeoDataset, aug_backend=aug_backend)
+        normalize = dm._build_normalize(aug_backend)
+        assert type(dm.aug) is type(normalize)
+        for aug in [dm.aug, normalize]:
+            batch = {"image": torch.full((1, 3, 2, 2), 255.0)}
+            batch = aug(batch)
+            assert torch.allclose(batch["image"], torch.ones(1, 3, 2, 2))
+
+    def test_invalid_aug_backend(self) -> None:
+        with pytest.raises(ValueError, match="Unsupported augmentation backend"):
+            NonGeoDataModule(CustomNonGeoDataset, aug_backend="foo")
+
+    @pytest.mark.parametrize("per_sample", [False, True])
+    def test_make_aug(self, per_sample: bool) -> None:
+        torch.manual_seed(0)
+        dm = CustomNonGeoDataModule()
+        aug = dm._make_aug(K.RandomHorizontalFlip(p=0.5), per_sample=per_sample)
+        image = torch.arange(4.0).view(1, 1, 1, 4).repeat(16, 3, 1, 1)
+        batch = aug({"image": image.clone()})
+        expected = image[0] / 255
+        flipped = [torch.allclose(x, expected.flip(-1)) for x in batch["image"]]
+        unflipped = [torch.allclose(x, expected) for x in batch["image"]]
+        assert all(f != u for f, u in zip(flipped, unflipped))
+        if per_sample:
+            assert any(flipped) and not all(flipped)
+        else:
+            assert all(flipped) or not any(flipped)
+
+    def test_drop_last(self) -> None:
+        dm = NonGeoDataModule(CustomNonGeoDataset, 2, length=3)
+        dm.setup("fit")
+        assert len(dm.train_dataloader()) == 1
+        assert len(dm.val_dataloader()) == 2
+
+    def test_drop_last_small_dataset(self) -> None:
+        dm = NonGeoDataModule(CustomNonGeoDataset, 2, length=1)
+        dm.setup("fit")
+        assert len(dm.train_dataloader()) == 1
+
+    def test_seed(self) -> None:
+        orders = []
+        for _ in range(2):
+            dm = NonGeoDataModule(CustomNonGeoDataset, seed=0, length=10)
+            dm.setup("fit")
+            orders.append(list(dm.train_dataloader().sampler))
+        assert orders[0] == orders[1]
+        assert sorted(orders[0]) == list(range(10))
+
+    def test_pinned_budget(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setattr(torch.cuda, "is_available", lambda: True)
+        # Each batch of 1 sample from each of 2 workers takes 2 * 96 bytes
+        budget = 2 * 2 * 96 / 2**30
+        dm = NonGeoDataModule(
+            CustomNonGeoDataset, 1, 2, prefetch_factor=4, pinned_budget_gb=budget
+        )
+        dm.setup("fit")
+        with pytest.warns(UserWarning, match="Reducing prefetch_factor from 4 to 2"):
+            dataloader = dm.train_dataloader()
+        assert dataloader.prefetch_factor == 2
+
+        # Later loaders for the same split reuse the estimate without probing
+        def probe(self: CustomNonGeoDataset, index: int) -> dict[str, Tensor]:
+            raise AssertionError("dataset probed again")
+
+        monkeypatch.setattr(CustomNonGeoDataset, "__getitem__", probe)
+        assert dm.train_dataloader().prefetch_factor == 2
+
+    def test_compile_aug(self, monkeypatch: MonkeyPatch) -> None:
+        compiled = []
+
+        def mock_compile(model: Any, **kwargs: Any) -> Any:
+            compiled.append(model)
+            return model
+
+        monkeypatch.setattr(torch, "compile", mock_compile, raising=False)
+        dm = NonGeoDataModule(CustomNonGeoDataset, compile_aug=True)
+        dm.train_aug = dm._build_normalize("torch")
+        dm.trainer = Trainer(accelerator="cpu", max_epochs=1)
+        dm.trainer.training = True
+        dm.setup("fit")
+        for batch in [next(iter(dm.train_dataloader())) for _ in range(3)]:
+            dm.on_after_batch_transfer(batch, 0)
+        assert len(compiled) == 2
+        assert compiled[0] is dm.aug
+        assert compiled[1] is dm.train_aug
+
+    def test_compile_aug_without_image(self, monkeypatch: MonkeyPatch) -> None:
+        monkeypatch.setattr(torch, "compile", lambda aug, **kwargs: aug, raising=False)
+        dm = NonGeoDataModule(CustomNonGeoDataset, compile_aug=True)
+        dm.aug = lambda batch: batch
+        dm.trainer = Trainer(accelerator="cpu", max_epochs=1)
+        batch = dm.on_after_batch_transfer({"mask": torch.zeros(1, 2, 2)}, 0)
+        assert "image" not in batch
+        assert dm._aug_compiled
+
+    def test_num_workers_auto(self) -> None:
+        dm = NonGeoDataModule(CustomNonGeoDataset, 1, -1)
+        assert 1 <= dm.num_workers <= 8
+
+    def test_dataloader_workers(self) -> None:
+        dm = NonGeoDataModule(
+            CustomNonGeoDataset, 1, 2, prefetch_factor=4, persistent_workers=True
+        )
+        dm.setup("fit")
+        dataloader = dm.train_dataloader()
+        assert dataloader.prefetch_factor == 4
+        assert dataloader.persistent_workers
+
     def test_no_datasets(self) -> None:
         dm = CustomNonGeoDataModule()
         msg = r"CustomNonGeoDataModule\.setup must define one of "
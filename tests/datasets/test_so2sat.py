@@ -3,6 +3,7 @@
 
 import builtins
 import os
+import pickle
 from pathlib import Path
 from typing import Any
 
@@ -55,6 +56,12 @@ class TestSo2Sat:
     def test_len(self, dataset: So2Sat) -> None:
         assert len(dataset) == 2
 
+    def test_pickle(self, dataset: So2Sat) -> None:
+        dataset[0]
+        dataset = pickle.loads(pickle.dumps(dataset))
+        x = dataset[0]
+        assert isinstance(x["image"], torch.Tensor)
+
     def test_out_of_bounds(self, dataset: So2Sat) -> None:
         # h5py at version 2.10.0 raises a ValueError instead of an IndexError so we
         # check for both here
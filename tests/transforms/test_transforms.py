@@ -201,3 +201,22 @@ def test_sequential_transforms_augmentations(
     )
     output = train_transforms(batch_multispectral)
     assert_matching(output, expected)
+
+
+def test_fast_normalize(batch_multispectral: dict[str, Tensor]) -> None:
+    mean = torch.arange(5, dtype=torch.float)
+    std = torch.arange(1, 6, dtype=torch.float)
+    expected = transforms.AugmentationSequential(
+        K.Normalize(mean=mean, std=std), data_keys=["image"]
+    )({"image": batch_multispectral["image"].clone()})
+    normalize = transforms._FastNormalize(mean, std)
+    output = normalize(batch_multispectral)
+    assert torch.allclose(output["image"], expected["image"])
+    assert normalize.scale.device == output["image"].device
+
+
+def test_fast_normalize_uint8() -> None:
+    batch = {"image": torch.full((1, 3, 2, 2), 255, dtype=torch.uint8)}
+    output = transforms._FastNormalize(torch.tensor(0), torch.tensor(255))(batch)
+    assert output["image"].dtype == torch.float
+    assert torch.allclose(output["image"], torch.ones(1, 3, 2, 2))
@@ -3,10 +3,11 @@
 
 """COWC datamodule."""
 
-from typing import Any
+from typing import Any, cast
 
+import torch
 from torch import Generator
-from torch.utils.data import random_split
+from torch.utils.data import Subset
 
 from ..datasets import COWCCounting
 from .geo import NonGeoDataModule
@@ -16,17 +17,38 @@ class COWCCountingDataModule(NonGeoDataModule):
     """LightningDataModule implementation for the COWC Counting dataset."""
 
     def __init__(
-        self, batch_size: int = 64, num_workers: int = 0, **kwargs: Any
+        self,
+        batch_size: int = 64,
+        num_workers: int = 0,
+        pin_memory: bool = True,
+        prefetch_factor: int = 2,
+        persistent_workers: bool = True,
+        **kwargs: Any,
     ) -> None:
         """Initialize a new COWCCountingDataModule instance.
 
         Args:
             batch_size: Size of each mini-batch.
             num_workers: Number of workers for parallel data loading.
+            pin_memory: If True, copy batches into page-locked memory before they
+                are transferred to a CUDA device.
+            prefetch_factor: Number of batches loaded in advance by each worker.
+            persistent_workers: If True, keep worker processes alive between epochs.
             **kwargs: Additional keyword arguments passed to
                 :class:`~torchgeo.datasets.COWCCounting`.
+
+        .. versionadded:: 0.5
+           The *pin_memory*, *prefetch_factor*, and *persistent_workers* parameters.
         """
-        super().__init__(COWCCounting, batch_size, num_workers, **kwargs)
+        super().__init__(
+            COWCCounting,
+            batch_size,
+            num_workers,
+            pin_memory,
+            prefetch_factor,
+            persistent_workers,
+            **kwargs,
+        )
 
     def setup(self, stage: str) -> None:
         """Set up datasets.
@@ -34,10 +56,24 @@ class COWCCountingDataModule(NonGeoDataModule):
         Args:
             stage: Either 'fit', 'validate', 'test', or 'predict'.
         """
-        self.dataset = COWCCounting(split="train", **self.kwargs)
-        self.test_dataset = COWCCounting(split="test", **self.kwargs)
-        self.train_dataset, self.val_dataset = random_split(
-            self.dataset,
-            [len(self.dataset) - len(self.test_dataset), len(self.test_dataset)],
-            generator=Generator().manual_seed(0),
+        dataset = cast(COWCCounting, self._cached_dataset("train"))
+        test_dataset = cast(COWCCounting, self._cached_dataset("test"))
+        self.dataset = dataset
+        self.test_dataset = test_dataset
+
+        # Unless user transforms expect float images, images stay uint8 until they
+        # are converted on the device, see on_after_batch_transfer
+        if dataset.transforms is None:
+            dataset._float_images = False
+            test_dataset._float_images = False
+
+        # Same samples as random_split with a seeded generator. The validation
+        # subset is sorted by file path so that images from the same site are
+        # read together; the training subset is shuffled by its sampler anyway
+        train_length = len(dataset) - len(self.test_dataset)
+        generator = Generator().manual_seed(0)
+        indices = torch.randperm(len(dataset), generator=generator).tolist()
+        self.train_dataset = Subset(dataset, indices[:train_length])
+        self.val_dataset = Subset(
+            dataset, sorted(indices[train_length:], key=lambda i: dataset.images[i])
         )
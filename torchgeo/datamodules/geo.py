@@ -3,14 +3,17 @@
 
 """Base classes for all :mod:`torchgeo` data modules."""
 
-from typing import Any, Callable, Optional, Union, cast
+import os
+import warnings
+from typing import Any, Callable, ClassVar, Optional, Union, cast
 
 import kornia.augmentation as K
 import torch
 from lightning.pytorch import LightningDataModule
+from lightning.pytorch.trainer.states import RunningStage
 from matplotlib.figure import Figure
 from torch import Tensor
-from torch.utils.data import DataLoader, Dataset, default_collate
+from torch.utils.data import DataLoader, Dataset, RandomSampler, default_collate
 
 from ..datasets import GeoDataset, NonGeoDataset, stack_samples
 from ..samplers import (
@@ -20,6 +23,7 @@ from ..samplers import (
     RandomBatchGeoSampler,
 )
 from ..transforms import AugmentationSequential
+from ..transforms.transforms import _FastNormalize
 from .utils import MisconfigurationException
 
 
@@ -32,6 +36,15 @@ class BaseDataModule(LightningDataModule):
     mean = torch.tensor(0)
     std = torch.tensor(255)
 
+    # Dataset split whose augmentations apply to each trainer stage
+    _splits: ClassVar[dict[Optional[RunningStage], str]] = {
+        RunningStage.TRAINING: "train",
+        RunningStage.SANITY_CHECKING: "val",
+        RunningStage.VALIDATING: "val",
+        RunningStage.TESTING: "test",
+        RunningStage.PREDICTING: "predict",
+    }
+
     def __init__(
         self,
         dataset_class: type[Dataset[dict[str, Tensor]]],
@@ -127,16 +140,12 @@ class BaseDataModule(LightningDataModule):
             A batch of data.
         """
         if self.trainer:
-            if self.trainer.training:
-                split = "train"
-            elif self.trainer.validating or self.trainer.sanity_checking:
-                split = "val"
-            elif self.trainer.testing:
-                split = "test"
-            elif self.trainer.predicting:
-                split = "predict"
-
-            aug = self._valid_attribute(f"{split}_aug", "aug")
+            # A single lookup instead of querying each trainer state property
+            split = self._splits.get(self.trainer.state.stage)
+            if split is None:
+                aug = self._valid_attribute("aug")
+            else:
+                aug = self._valid_attribute(f"{split}_aug", "aug")
             batch = aug(batch)
 
         return batch
@@ -367,6 +376,14 @@ class NonGeoDataModule(BaseDataModule):
         dataset_class: type[NonGeoDataset],
         batch_size: int = 1,
         num_workers: int = 0,
+        pin_memory: bool = True,
+        prefetch_factor: int = 2,
+        persistent_workers: bool = True,
+        compile_aug: bool = False,
+        drop_last: bool = True,
+        aug_backend: str = "torch",
+        seed: Optional[int] = None,
+        pinned_budget_gb: float = 4.0,
         **kwargs: Any,
     ) -> None:
         """Initialize a new NonGeoDataModule instance.
@@ -374,14 +391,119 @@ class NonGeoDataModule(BaseDataModule):
         Args:
             dataset_class: Class used to instantiate a new dataset.
             batch_size: Size of each mini-batch.
-            num_workers: Number of workers for parallel data loading.
+            num_workers: Number of workers for parallel data loading. If negative,
+                use one worker per CPU, up to 8.
+            pin_memory: If True, copy batches into page-locked memory before they
+                are transferred to a CUDA device. Only has an effect when CUDA is
+                available. Tensors nested in dicts, lists, and tuples are pinned,
+                other values such as file names are passed through unchanged.
+            prefetch_factor: Number of batches loaded in advance by each worker.
+                Ignored when *num_workers* is 0.
+            persistent_workers: If True, keep worker processes alive between
+                epochs instead of respawning them. Ignored when *num_workers* is 0.
+            compile_aug: If True, compile batch augmentations with
+                :func:`torch.compile` on first use. Fuses small elementwise
+                kernels and captures them in a CUDA graph, which requires fixed
+                batch and image sizes. Requires PyTorch 2.0+.
+            drop_last: If True, drop the last incomplete training batch so that
+                every training batch has the same shape. Ignored if the training
+                set is smaller than a single batch. Validation, testing, and
+                prediction always use every sample.
+            aug_backend: Implementation of the default normalization, either
+                'torch' (plain tensor operations) or 'kornia'.
+            seed: Seed for shuffling the training set. If None, a seed is drawn
+                from the global PyTorch RNG when the training loader is created.
+            pinned_budget_gb: Maximum size in GiB of batches held in pinned memory
+                by the workers. *prefetch_factor* is reduced, down to 1, if needed.
             **kwargs: Additional keyword arguments passed to ``dataset_class``
+
+        Raises:
+            ValueError: If *aug_backend* is not supported.
+
+        .. versionadded:: 0.5
+           The *pin_memory*, *prefetch_factor*, *persistent_workers*,
+           *compile_aug*, *drop_last*, *aug_backend*, *seed*, and
+           *pinned_budget_gb* parameters, and support for negative *num_workers*.
         """
+        if num_workers < 0:
+            num_workers = min(os.cpu_count() or 1, 8)
+
         super().__init__(dataset_class, batch_size, num_workers, **kwargs)
 
+        self.pin_memory = pin_memory
+        self.prefetch_factor = prefetch_factor
+        self.persistent_workers = persistent_workers
+        self.compile_aug = compile_aug
+        self.drop_last = drop_last
+        self.seed = seed
+        self.pinned_budget_gb = pinned_budget_gb
+        self._aug_compiled = False
+
+        # Reused by the training sampler so shuffling continues across epochs
+        self._train_generator: Optional[torch.Generator] = None
+
+        # Datasets already instantiated by setup, keyed by split
+        self._dataset_cache: dict[str, NonGeoDataset] = {}
+
+        # Prefetch factors already fitted to the pinned memory budget, keyed by split
+        self._prefetch_factors: dict[str, int] = {}
+
+        # Data augmentation
+        self.aug_backend = aug_backend
+        self.aug = self._build_normalize(aug_backend)
+
         # Collation
         self.collate_fn = default_collate
 
+    def _build_normalize(self, backend: str) -> torch.nn.Module:
+        """Build the normalization that starts every batch augmentation.
+
+        Args:
+            backend: Either 'torch' or 'kornia'.
+
+        Returns:
+            The normalization module.
+
+        Raises:
+            ValueError: If *backend* is not supported.
+        """
+        if backend == "torch":
+            return _FastNormalize(self.mean, self.std)
+        elif backend == "kornia":
+            return AugmentationSequential(
+                K.Normalize(mean=self.mean, std=self.std), data_keys=["image"]
+            )
+        else:
+            raise ValueError(f"Unsupported augmentation backend: '{backend}'.")
+
+    def _make_aug(
+        self,
+        *args: Union[K.base._AugmentationBase, K.ImageSequential],
+        data_keys: Optional[list[str]] = None,
+        per_sample: bool = False,
+    ) -> torch.nn.Module:
+        """Build a batch augmentation pipeline that starts with normalization.
+
+        Normalization uses the same *aug_backend* as the default augmentation.
+        By default, random parameters are sampled once and shared by every sample
+        in the batch, which avoids per-sample parameter generation and is usually
+        acceptable for large batches of tiles.
+
+        Args:
+            *args: Kornia augmentations applied after normalization.
+            data_keys: Inputs to augment, defaults to ``["image"]``.
+            per_sample: If True, sample new random parameters for each sample.
+
+        Returns:
+            The augmentation pipeline.
+        """
+        return torch.nn.Sequential(
+            self._build_normalize(self.aug_backend),
+            AugmentationSequential(
+                *args, data_keys=data_keys or ["image"], same_on_batch=not per_sample
+            ),
+        )
+
     def setup(self, stage: str) -> None:
         """Set up datasets.
 
@@ -393,17 +515,29 @@ class NonGeoDataModule(BaseDataModule):
             stage: Either 'fit', 'validate', 'test', or 'predict'.
         """
         if stage in ["fit"]:
-            self.train_dataset = self.dataset_class(  # type: ignore[call-arg]
-                split="train", **self.kwargs
-            )
+            self.train_dataset = self._cached_dataset("train")
         if stage in ["fit", "validate"]:
-            self.val_dataset = self.dataset_class(  # type: ignore[call-arg]
-                split="val", **self.kwargs
-            )
+            self.val_dataset = self._cached_dataset("val")
         if stage in ["test"]:
-            self.test_dataset = self.dataset_class(  # type: ignore[call-arg]
-                split="test", **self.kwargs
+            self.test_dataset = self._cached_dataset("test")
+
+    def _cached_dataset(self, split: str) -> NonGeoDataset:
+        """Instantiate a dataset, reusing it if it was created by an earlier stage.
+
+        Lightning calls :meth:`setup` once per stage, so without caching every stage
+        transition would repeat the file system scans done by the dataset.
+
+        Args:
+            split: Split passed to ``dataset_class``.
+
+        Returns:
+            The dataset for the requested split.
+        """
+        if split not in self._dataset_cache:
+            self._dataset_cache[split] = self.dataset_class(  # type: ignore[call-arg]
+                split=split, **self.kwargs
             )
+        return self._dataset_cache[split]
 
     def _dataloader_factory(self, split: str) -> DataLoader[dict[str, Tensor]]:
         """Implement one or more PyTorch DataLoaders.
@@ -420,13 +554,81 @@ class NonGeoDataModule(BaseDataModule):
         """
         dataset = self._valid_attribute(f"{split}_dataset", "dataset")
         batch_size = self._valid_attribute(f"{split}_batch_size", "batch_size")
+
+        # These options are only valid when loading with worker processes
+        kwargs: dict[str, Any] = {}
+        if self.num_workers > 0:
+            kwargs["prefetch_factor"] = self._prefetch_factor(
+                split, dataset, batch_size
+            )
+            kwargs["persistent_workers"] = self.persistent_workers
+
+        sampler = None
+        if split == "train":
+            if self._train_generator is None:
+                seed = self.seed
+                if seed is None:
+                    seed = int(torch.empty((), dtype=torch.int64).random_().item())
+                self._train_generator = torch.Generator().manual_seed(seed)
+            sampler = RandomSampler(dataset, generator=self._train_generator)
+
+        # Never drop the only batch of a dataset smaller than a single batch
+        drop_last = split == "train" and self.drop_last
+        drop_last = drop_last and len(dataset) >= batch_size
+
         return DataLoader(
             dataset=dataset,
             batch_size=batch_size,
-            shuffle=split == "train",
+            sampler=sampler,
             num_workers=self.num_workers,
             collate_fn=self.collate_fn,
+            drop_last=drop_last,
+            pin_memory=self.pin_memory and torch.cuda.is_available(),
+            **kwargs,
+        )
+
+    def _prefetch_factor(
+        self, split: str, dataset: NonGeoDataset, batch_size: int
+    ) -> int:
+        """Limit prefetching so that batches in flight fit in the pinned memory budget.
+
+        Each worker holds up to *prefetch_factor* batches, which are all pinned
+        and cannot be released until they are consumed. The size of a batch is
+        estimated from the first sample of the dataset, once per split.
+
+        Args:
+            split: Either 'train', 'val', 'test', or 'predict'.
+            dataset: Dataset to load.
+            batch_size: Size of each mini-batch.
+
+        Returns:
+            The prefetch factor to use.
+        """
+        if not (self.pin_memory and torch.cuda.is_available()):
+            return self.prefetch_factor
+
+        if split in self._prefetch_factors:
+            return self._prefetch_factors[split]
+
+        sample = dataset[0]
+        sample_bytes = sum(
+            value.element_size() * value.numel()
+            for value in sample.values()
+            if isinstance(value, Tensor)
         )
+        batch_bytes = max(1, sample_bytes * batch_size * self.num_workers)
+        budget = int(self.pinned_budget_gb * 2**30)
+        prefetch_factor = max(1, min(self.prefetch_factor, budget // batch_bytes))
+
+        if prefetch_factor < self.prefetch_factor:
+            warnings.warn(
+                f"Reducing prefetch_factor from {self.prefetch_factor} to "
+                f"{prefetch_factor} to fit in {self.pinned_budget_gb} GiB of "
+                "pinned memory"
+            )
+
+        self._prefetch_factors[split] = prefetch_factor
+        return prefetch_factor
 
     def train_dataloader(self) -> DataLoader[dict[str, Tensor]]:
         """Implement one or more PyTorch DataLoaders for training.
@@ -475,3 +677,48 @@ class NonGeoDataModule(BaseDataModule):
                 dataset, or if the dataset has length 0.
         """
         return self._dataloader_factory("predict")
+
+    def on_after_batch_transfer(
+        self, batch: dict[str, Tensor], dataloader_idx: int
+    ) -> dict[str, Tensor]:
+        """Apply batch augmentations to the batch after it is transferred to the device.
+
+        Integer images are cast to floating point here, on the device, so that
+        datasets can return compact uint8 images that are cheaper to copy.
+
+        Args:
+            batch: A batch of data that needs to be altered or augmented.
+            dataloader_idx: The index of the dataloader to which the batch belongs.
+
+        Returns:
+            A batch of data.
+        """
+        if "image" in batch and not batch["image"].is_floating_point():
+            batch["image"] = batch["image"].float()
+
+        if self.compile_aug and not self._aug_compiled:
+            for value in batch.values():
+                if isinstance(value, Tensor):
+                    self._compile_aug(value.device)
+                    break
+
+        return super().on_after_batch_transfer(batch, dataloader_idx)
+
+    def _compile_aug(self, device: torch.device) -> None:
+        """Compile all batch augmentations with :func:`torch.compile`.
+
+        Done lazily so that augmentations defined by subclasses after
+        :meth:`__init__` are compiled as well. Augmentation modules are moved to
+        *device* first so that moving their buffers does not break the graph.
+
+        Args:
+            device: Device that batches are augmented on.
+        """
+        for name in ["aug", "train_aug", "val_aug", "test_aug", "predict_aug"]:
+            aug = getattr(self, name)
+            if aug is not None:
+                if isinstance(aug, torch.nn.Module):
+                    aug.to(device)
+                aug = torch.compile(aug, mode="reduce-overhead", dynamic=False)
+                setattr(self, name, aug)
+        self._aug_compiled = True
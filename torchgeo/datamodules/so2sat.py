@@ -167,6 +167,9 @@ class So2SatDataModule(NonGeoDataModule):
         num_workers: int = 0,
         band_set: str = "all",
         val_split_pct: float = 0.2,
+        pin_memory: bool = True,
+        prefetch_factor: int = 2,
+        persistent_workers: bool = True,
         **kwargs: Any,
     ) -> None:
         """Initialize a new So2SatDataModule instance.
@@ -177,11 +180,16 @@ class So2SatDataModule(NonGeoDataModule):
             band_set: One of 'all', 's1', 's2', or 'rgb'.
             val_split_pct: Percentage of training data to use for validation in with
                 the version 3 datasets.
+            pin_memory: If True, copy batches into page-locked memory before they
+                are transferred to a CUDA device.
+            prefetch_factor: Number of batches loaded in advance by each worker.
+            persistent_workers: If True, keep worker processes alive between epochs.
             **kwargs: Additional keyword arguments passed to
                 :class:`~torchgeo.datasets.So2Sat`.
 
         .. versionadded:: 0.5
-           The *val_split_pct* parameter, and the 'rgb' argument to *band_set*.
+           The *val_split_pct*, *pin_memory*, *prefetch_factor*, and
+           *persistent_workers* parameters, and the 'rgb' argument to *band_set*.
         """
         # https://github.com/Lightning-AI/lightning/issues/18616
         kwargs["version"] = str(kwargs.get("version", "2"))
@@ -199,7 +207,15 @@ class So2SatDataModule(NonGeoDataModule):
             self.mean = self.means_per_version[version][[10, 9, 8]]
             self.std = self.stds_per_version[version][[10, 9, 8]]
 
-        super().__init__(So2Sat, batch_size, num_workers, **kwargs)
+        super().__init__(
+            So2Sat,
+            batch_size,
+            num_workers,
+            pin_memory,
+            prefetch_factor,
+            persistent_workers,
+            **kwargs,
+        )
 
     def setup(self, stage: str) -> None:
         """Set up datasets.
@@ -213,14 +229,14 @@ class So2SatDataModule(NonGeoDataModule):
         """
         if self.kwargs.get("version", "2") == "2":
             if stage in ["fit"]:
-                self.train_dataset = So2Sat(split="train", **self.kwargs)
+                self.train_dataset = self._cached_dataset("train")
             if stage in ["fit", "validate"]:
-                self.val_dataset = So2Sat(split="validation", **self.kwargs)
+                self.val_dataset = self._cached_dataset("validation")
             if stage in ["test"]:
-                self.test_dataset = So2Sat(split="test", **self.kwargs)
+                self.test_dataset = self._cached_dataset("test")
         else:
             if stage in ["fit", "validate"]:
-                dataset = So2Sat(split="train", **self.kwargs)
+                dataset = self._cached_dataset("train")
                 val_length = round(len(dataset) * self.val_split_pct)
                 train_length = len(dataset) - val_length
                 self.train_dataset, self.val_dataset = random_split(
@@ -229,4 +245,4 @@ class So2SatDataModule(NonGeoDataModule):
                     generator=Generator().manual_seed(0),
                 )
             if stage in ["test"]:
-                self.test_dataset = So2Sat(split="test", **self.kwargs)
+                self.test_dataset = self._cached_dataset("test")
@@ -9,11 +9,10 @@ import os
 from typing import Callable, Optional, cast
 
 import matplotlib.pyplot as plt
-import numpy as np
 import torch
 from matplotlib.figure import Figure
-from PIL import Image
 from torch import Tensor
+from torchvision.io import ImageReadMode, read_image
 
 from .geo import NonGeoDataset
 from .utils import check_integrity, download_and_extract_archive
@@ -41,6 +40,10 @@ class COWC(NonGeoDataset, abc.ABC):
     * https://doi.org/10.1007/978-3-319-46487-9_48
     """
 
+    # Cast images to floating point when loading them. The COWC datamodule turns
+    # this off so that compact uint8 images are only converted on the device.
+    _float_images = True
+
     @property
     @abc.abstractmethod
     def base_url(self) -> str:
@@ -145,13 +148,23 @@ class COWC(NonGeoDataset, abc.ABC):
         Returns:
             the image
         """
+        image = self._read_image(index)
+        if self._float_images:
+            image = image.float()
+        return image
+
+    def _read_image(self, index: int) -> Tensor:
+        """Decode a single image without converting its data type.
+
+        Args:
+            index: index to return
+
+        Returns:
+            the uint8 image
+        """
         filename = os.path.join(self.root, self.images[index])
-        with Image.open(filename) as img:
-            array: "np.typing.NDArray[np.int_]" = np.array(img)
-            tensor = torch.from_numpy(array).float()
-            # Convert from HxWxC to CxHxW
-            tensor = tensor.permute((2, 0, 1))
-            return tensor
+        # Decodes with libpng/libjpeg directly into a CxHxW tensor
+        return read_image(filename, ImageReadMode.UNCHANGED)
 
     def _load_target(self, index: int) -> Tensor:
         """Load a single target.
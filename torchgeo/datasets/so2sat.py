@@ -5,7 +5,7 @@
 
 import os
 from collections.abc import Sequence
-from typing import Callable, Optional, cast
+from typing import Any, Callable, Optional, cast
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -262,6 +262,10 @@ class So2Sat(NonGeoDataset):
         with h5py.File(self.fn, "r") as f:
             self.size: int = f["label"].shape[0]
 
+        # HDF5 file handle, opened lazily by each process that reads samples
+        self._file: Optional[Any] = None
+        self._pid: Optional[int] = None
+
     def __getitem__(self, index: int) -> dict[str, Tensor]:
         """Return an index within the dataset.
 
@@ -271,30 +275,56 @@ class So2Sat(NonGeoDataset):
         Returns:
             data and label at that index
         """
-        import h5py
-
-        with h5py.File(self.fn, "r") as f:
-            s1 = f["sen1"][index].astype(np.float64)  # convert from <f8 to float64
-            s1 = np.take(s1, indices=self.s1_band_indices, axis=2)
-            s2 = f["sen2"][index].astype(np.float64)  # convert from <f8 to float64
-            s2 = np.take(s2, indices=self.s2_band_indices, axis=2)
+        f = self._open()
 
-            # convert one-hot encoding to int64 then torch int
-            label = torch.tensor(f["label"][index].argmax())
+        # select (and reorder) bands before any other copy is made
+        s1 = np.take(f["sen1"][index], indices=self.s1_band_indices, axis=2)
+        s2 = np.take(f["sen2"][index], indices=self.s2_band_indices, axis=2)
 
-            s1 = np.rollaxis(s1, 2, 0)  # convert to CxHxW format
-            s2 = np.rollaxis(s2, 2, 0)  # convert to CxHxW format
+        # convert one-hot encoding to int64 then torch int
+        label = torch.tensor(f["label"][index].argmax())
 
-            s1 = torch.from_numpy(s1)
-            s2 = torch.from_numpy(s2)
+        # convert to CxHxW format and float32 in a single copy
+        image = np.concatenate([s1, s2], axis=2)
+        image = np.ascontiguousarray(np.rollaxis(image, 2, 0), dtype=np.float32)
 
-        sample = {"image": torch.cat([s1, s2]).float(), "label": label}
+        sample = {"image": torch.from_numpy(image), "label": label}
 
         if self.transforms is not None:
             sample = self.transforms(sample)
 
         return sample
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Define how instances are pickled.
+
+        Open file handles cannot be pickled, so workers reopen the file.
+
+        Returns:
+            the state necessary to unpickle the instance
+        """
+        state = self.__dict__.copy()
+        state["_file"] = None
+        state["_pid"] = None
+        return state
+
+    def _open(self) -> Any:
+        """Open the HDF5 file once per process.
+
+        Opening the file parses its metadata, which is too slow to repeat for every
+        sample. Handles cannot be shared across processes, so each DataLoader worker
+        opens its own.
+
+        Returns:
+            the open HDF5 file
+        """
+        import h5py
+
+        if self._file is None or self._pid != os.getpid():
+            self._file = h5py.File(self.fn, "r")
+            self._pid = os.getpid()
+        return self._file
+
     def __len__(self) -> int:
         """Return the number of data points in the dataset.
 
@@ -91,6 +91,47 @@ class AugmentationSequential(Module):
         return batch
 
 
+class _FastNormalize(Module):
+    """Normalize images using plain tensor operations.
+
+    Equivalent to :class:`kornia.augmentation.Normalize` applied to the "image" key,
+    but without Kornia's per-call dispatch and parameter generation overhead.
+    """
+
+    def __init__(self, mean: Tensor, std: Tensor) -> None:
+        """Initialize a new _FastNormalize instance.
+
+        Args:
+            mean: mean value for each channel, or a single value for all channels
+            std: standard deviation for each channel, or a single value for all
+                channels
+        """
+        super().__init__()
+        mean = torch.as_tensor(mean, dtype=torch.float).view(1, -1, 1, 1)
+        std = torch.as_tensor(std, dtype=torch.float).view(1, -1, 1, 1)
+
+        # (x - mean) / std == x * scale + shift, computed by a single kernel
+        self.register_buffer("scale", 1 / std)
+        self.register_buffer("shift", -mean / std)
+
+    def forward(self, batch: dict[str, Tensor]) -> dict[str, Tensor]:
+        """Normalize the image in a batch.
+
+        Args:
+            batch: the input
+
+        Returns:
+            the normalized input
+        """
+        x = batch["image"]
+        # Move the statistics once instead of copying them for every batch
+        if self.scale.device != x.device:
+            self.to(x.device)
+        x = x.to(self.scale.dtype)
+        batch["image"] = torch.addcmul(self.shift, x, self.scale)
+        return batch
+
+
 class _RandomNCrop(K.GeometricAugmentationBase2D):
     """Take N random crops of a tensor."""
 